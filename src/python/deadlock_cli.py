@@ -1,7 +1,7 @@
 
 import sys
 from resource_manager import ResourceManager
-from deadlock_detector import DetectionResult
+from deadlock_detector import format_steps
 
 class DeadlockDetectionCLI:
     def __init__(self):
@@ -49,19 +49,21 @@ class DeadlockDetectionCLI:
                 print(f"Error: {e}")
     
     def show_help(self, args):
-        print("Available commands:")
-        print("  help                                   - Show this help message")
-        print("  add-process <process_id>              - Add a new process")
-        print("  add-resource <resource_id> [instances] - Add a new resource (default: 1 instance)")
-        print("  update-allocation <process> <resource> <value> - Set allocation value")
-        print("  update-request <process> <resource> <value> - Set request value")
-        print("  remove-process <process_id>           - Remove a process")
-        print("  remove-resource <resource_id>         - Remove a resource")
-        print("  show-matrix                           - Show allocation and request matrices")
-        print("  detect-deadlock                       - Run deadlock detection algorithm")
-        print("  load-example                          - Load a sample example")
-        print("  clear                                 - Clear all processes and resources")
-        print("  exit                                  - Exit the program")
+        print("\n".join([
+            "Available commands:",
+            "  help                                   - Show this help message",
+            "  add-process <process_id>              - Add a new process",
+            "  add-resource <resource_id> [instances] - Add a new resource (default: 1 instance)",
+            "  update-allocation <process> <resource> <value> - Set allocation value",
+            "  update-request <process> <resource> <value> - Set request value",
+            "  remove-process <process_id>           - Remove a process",
+            "  remove-resource <resource_id>         - Remove a resource",
+            "  show-matrix                           - Show allocation and request matrices",
+            "  detect-deadlock                       - Run deadlock detection algorithm",
+            "  load-example                          - Load a sample example",
+            "  clear                                 - Clear all processes and resources",
+            "  exit                                  - Exit the program",
+        ]))
     
     def add_process(self, args):
         if not args:
@@ -174,13 +176,7 @@ class DeadlockDetectionCLI:
         print("="*50)
         
         print("\nStep-by-step explanation:")
-        for i, step in enumerate(result.steps):
-            print(f"\nStep {i+1}: {step.description}")
-            if step.processed_this_round:
-                print(f"Processed: {', '.join(step.processed_this_round)}")
-            print(f"Available resources: {step.available_resources}")
-            if step.remaining_processes:
-                print(f"Remaining processes: {', '.join(step.remaining_processes)}")
+        print(format_steps(result.steps))
     
     def load_example(self, args):
         self.resource_manager.load_example()
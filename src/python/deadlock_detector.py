@@ -1,14 +1,18 @@
 
+import numbers
 import numpy as np
-import pandas as pd
 
 class Process:
+    __slots__ = ('id', 'allocation', 'request')
+    
     def __init__(self, id):
         self.id = id
         self.allocation = {}  # Resources currently allocated to this process
         self.request = {}     # Resources requested by this process
 
 class Resource:
+    __slots__ = ('id', 'total', 'available', 'is_multi_instance')
+    
     def __init__(self, id, total):
         self.id = id
         self.total = total
@@ -16,11 +20,15 @@ class Resource:
         self.is_multi_instance = total > 1
 
 class AllocationMatrix:
+    __slots__ = ('processes', 'resources')
+    
     def __init__(self):
         self.processes = []
         self.resources = []
 
 class DetectionStep:
+    __slots__ = ('description', 'remaining_processes', 'available_resources', 'processed_this_round')
+    
     def __init__(self, description, remaining_processes, available_resources, processed_this_round):
         self.description = description
         self.remaining_processes = remaining_processes
@@ -28,6 +36,8 @@ class DetectionStep:
         self.processed_this_round = processed_this_round
 
 class DetectionResult:
+    __slots__ = ('deadlocked', 'safe_sequence', 'steps')
+    
     def __init__(self):
         self.deadlocked = []       # Process IDs that are deadlocked
         self.safe_sequence = None  # Safe execution sequence if no deadlock
@@ -35,38 +45,90 @@ class DetectionResult:
 
 def calculate_available_resources(matrix):
     """Calculate available resources based on total and allocations"""
+    # New resources start with available equal to total
     resources = [Resource(r.id, r.total) for r in matrix.resources]
-    
-    # Reset available to total
+    by_id = {}
     for resource in resources:
-        resource.available = resource.total
+        by_id.setdefault(resource.id, []).append(resource)
     
-    # Subtract allocated resources
+    # Subtract allocated resources from every resource with that id
     for process in matrix.processes:
         for resource_id, allocated in process.allocation.items():
-            for resource in resources:
-                if resource.id == resource_id:
-                    resource.available -= allocated
+            for resource in by_id.get(resource_id, ()):
+                resource.available -= allocated
     
     return resources
 
+def _fits_int64(values, terms):
+    """Check that integer counts can be summed `terms` at a time without int64 overflow"""
+    if not all(isinstance(value, numbers.Integral) for value in values):
+        return False
+    return max(map(abs, values), default=0) * terms <= np.iinfo(np.int64).max
+
+def build_demand_arrays(matrix):
+    """Build dense allocation/request arrays (process x resource) for the matrix"""
+    processes = matrix.processes
+    
+    # Processes may reference resources outside matrix.resources; a
+    # repeated resource id shares one column
+    resource_index = {}
+    for resource in matrix.resources:
+        resource_index.setdefault(resource.id, len(resource_index))
+    for process in processes:
+        for resource_id in list(process.allocation) + list(process.request):
+            if resource_id not in resource_index:
+                resource_index[resource_id] = len(resource_index)
+    
+    # Non-integer or very large counts go in object arrays so they are
+    # compared exactly instead of being truncated or overflowing int64.
+    # Work never exceeds a total plus twice every allocation in magnitude.
+    counts = [
+        value
+        for process in processes
+        for demand in (process.allocation, process.request)
+        for value in demand.values()
+    ]
+    dtype = np.int64 if _fits_int64(counts, 2 * len(processes) + 2) else object
+    allocation = np.zeros((len(processes), len(resource_index)), dtype=dtype)
+    request = np.zeros_like(allocation)
+    for i, process in enumerate(processes):
+        for resource_id, allocated in process.allocation.items():
+            allocation[i, resource_index[resource_id]] = allocated
+        for resource_id, requested in process.request.items():
+            request[i, resource_index[resource_id]] = requested
+    
+    return allocation, request, resource_index
+
 def detect_deadlock(matrix):
     """Implement deadlock detection algorithm (Banker's algorithm variation)"""
-    # Deep copy the matrix
-    import copy
-    working_matrix = copy.deepcopy(matrix)
+    # The matrix is only read; all working state lives in available_resources
+    processes = matrix.processes
     
-    # Calculate available resources
-    working_matrix.resources = calculate_available_resources(working_matrix)
+    allocation, request, resource_index = build_demand_arrays(matrix)
     
-    available_resources = {}
-    for resource in working_matrix.resources:
-        available_resources[resource.id] = resource.available
+    # Available = total - allocated, summed per resource column in one pass.
+    # The matrix's resources lead resource_index; the rest start at 0.
+    totals = {r.id: r.total for r in matrix.resources}
+    if allocation.dtype == object or not _fits_int64(list(totals.values()), 2 * len(processes) + 2):
+        # Non-integer or very large counts: subtract one process at a time
+        # like calculate_available_resources so results stay identical
+        available_resources = {r.id: r.available for r in calculate_available_resources(matrix)}
+        work = np.array([available_resources.get(rid, 0) for rid in resource_index], dtype=object)
+        allocation, request = allocation.astype(object), request.astype(object)
+    else:
+        work = np.zeros(len(resource_index), dtype=np.int64)
+        work[:len(totals)] = np.fromiter(totals.values(), dtype=np.int64, count=len(totals))
+        work[:len(totals)] -= allocation[:, :len(totals)].sum(axis=0)
+        available_resources = dict(zip(totals, work[:len(totals)].tolist()))
+    finish = np.zeros(len(processes), dtype=bool)
+    has_request = (request > 0).any(axis=1)
     
     # Track processes that are finished
     finished = set()
     steps = []
-    all_process_ids = [p.id for p in working_matrix.processes]
+    all_process_ids = [p.id for p in processes]
+    # Processes are tracked by ID, so a finished ID covers every process sharing it
+    shared_ids = np.array(all_process_ids, dtype=object) if len(set(all_process_ids)) < len(processes) else None
     safe_sequence = []
     
     # Initial step - show available resources
@@ -77,75 +139,60 @@ def detect_deadlock(matrix):
         []
     ))
     
-    change_in_last_iteration = True
+    while True:
+        # A process can finish if every positive request fits in the work vector
+        blocked = ((request > work) & (request > 0)).any(axis=1)
+        candidates = np.flatnonzero(~finish & ~blocked)
+        if candidates.size == 0:
+            break
+        
+        # We only process one process at a time for clearer steps, always
+        # taking the first one that can finish
+        i = int(candidates[0])
+        process = processes[i]
+        
+        # Process can finish, release its resources
+        finish[i] = True
+        if shared_ids is not None:
+            finish[shared_ids == process.id] = True
+        finished.add(process.id)
+        safe_sequence.append(process.id)
+        work += allocation[i]
+        
+        for resource_id, allocated in process.allocation.items():
+            available_resources[resource_id] = available_resources.get(resource_id, 0) + allocated
+        
+        # Add detailed step for this process completion
+        satisfied = " Its resource requests can be satisfied." if has_request[i] else ""
+        description = (
+            f"Process {process.id} can be executed with the available resources."
+            f"{satisfied} After completion, {process.id} releases its resources."
+        )
+        
+        steps.append(DetectionStep(
+            description,
+            [pid for pid in all_process_ids if pid not in finished],
+            available_resources.copy(),
+            [process.id]
+        ))
     
-    while change_in_last_iteration:
-        change_in_last_iteration = False
-        processed_this_round = []
+    # If no process can finish and there are still unfinished processes, we have a deadlock
+    if len(finished) < len(processes):
+        deadlocked = [p.id for p in processes if p.id not in finished]
         
-        for process in working_matrix.processes:
-            # Skip already finished processes
-            if process.id in finished:
-                continue
-            
-            # Check if all requested resources can be satisfied
-            can_finish = True
-            
-            # For each resource the process requests
-            for resource_id, requested in process.request.items():
-                # Skip if requesting 0
-                if requested <= 0:
-                    continue
-                
-                available = available_resources.get(resource_id, 0)
-                if requested > available:
-                    can_finish = False
-                    break
-            
-            if can_finish:
-                # Process can finish, release its resources
-                finished.add(process.id)
-                safe_sequence.append(process.id)
-                
-                for resource_id, allocated in process.allocation.items():
-                    available_resources[resource_id] = available_resources.get(resource_id, 0) + allocated
-                
-                change_in_last_iteration = True
-                processed_this_round.append(process.id)
-                
-                # Add detailed step for this process completion
-                description = f"Process {process.id} can be executed with the available resources."
-                if process.request and any(val > 0 for val in process.request.values()):
-                    description += f" Its resource requests can be satisfied."
-                description += f" After completion, {process.id} releases its resources."
-                
-                steps.append(DetectionStep(
-                    description,
-                    [pid for pid in all_process_ids if pid not in finished],
-                    available_resources.copy(),
-                    [process.id]
-                ))
-                
-                # We only process one process at a time for clearer steps
-                break
+        # Add final step for deadlock detection
+        steps.append(DetectionStep(
+            f"No process can be satisfied with the available resources. Deadlock detected involving processes: {', '.join(deadlocked)}",
+            deadlocked,
+            available_resources.copy(),
+            []
+        ))
         
-        # If no process could finish in this iteration, and there are still unfinished processes, we have a deadlock
-        if not change_in_last_iteration and len(finished) < len(working_matrix.processes):
-            deadlocked = [p.id for p in working_matrix.processes if p.id not in finished]
-            
-            # Add final step for deadlock detection
-            steps.append(DetectionStep(
-                f"No process can be satisfied with the available resources. Deadlock detected involving processes: {', '.join(deadlocked)}",
-                deadlocked,
-                available_resources.copy(),
-                []
-            ))
-            
-            result = DetectionResult()
-            result.deadlocked = deadlocked
-            result.safe_sequence = None
-            result.steps = steps
-            return result
+        result = DetectionResult()
+        result.deadlocked = deadlocked
+        result.safe_sequence = None
+        result.steps = steps
+        return result
     
     # Add final step for safe completion
     if len(steps) > 1:
@@ -166,7 +213,6 @@ def detect_deadlock(matrix):
 def generate_resource_flow_graph(matrix):
     """Generate a graph representation of resource allocation"""
     nodes = []
-    edges = []
     
     # Create process nodes
     for process in matrix.processes:
@@ -188,35 +234,48 @@ def generate_resource_flow_graph(matrix):
             }
         })
     
-    # Create allocation edges (resource → process)
+    # Create allocation edges (resource → process) and request edges
+    # (process → resource) in a single pass over the processes
+    allocation_edges = []
+    request_edges = []
     for process in matrix.processes:
         for resource_id, amount in process.allocation.items():
             if amount > 0:
-                edges.append({
+                allocation_edges.append({
                     "id": f"{resource_id}-{process.id}",
                     "source": resource_id,
                     "target": process.id,
                     "type": "allocation",
                     "data": {"amount": amount}
                 })
-    
-    # Create request edges (process → resource)
-    for process in matrix.processes:
         for resource_id, amount in process.request.items():
             if amount > 0:
-                edges.append({
+                request_edges.append({
                     "id": f"{process.id}-{resource_id}",
                     "source": process.id,
                     "target": resource_id,
                     "type": "request",
                     "data": {"amount": amount}
                 })
+    edges = allocation_edges + request_edges
     
     return {
         "nodes": nodes,
         "edges": edges
     }
 
+def format_steps(steps):
+    """Render detection steps as a single block of text"""
+    lines = []
+    for i, step in enumerate(steps):
+        lines.append(f"\nStep {i+1}: {step.description}")
+        if step.processed_this_round:
+            lines.append(f"Processed: {', '.join(step.processed_this_round)}")
+        lines.append(f"Available resources: {step.available_resources}")
+        if step.remaining_processes:
+            lines.append(f"Remaining processes: {', '.join(step.remaining_processes)}")
+    return "\n".join(lines)
+
 # Example usage function
 def run_example():
     """Run an example deadlock detection scenario"""
@@ -255,13 +314,7 @@ def run_example():
         print(f"No deadlock. Safe sequence: {' → '.join(result.safe_sequence)}")
     
     print("\nStep-by-step explanation:")
-    for i, step in enumerate(result.steps):
-        print(f"\nStep {i+1}: {step.description}")
-        if step.processed_this_round:
-            print(f"Processed: {', '.join(step.processed_this_round)}")
-        print(f"Available resources: {step.available_resources}")
-        if step.remaining_processes:
-            print(f"Remaining processes: {', '.join(step.remaining_processes)}")
+    print(format_steps(result.steps))
 
 if __name__ == "__main__":
     run_example()
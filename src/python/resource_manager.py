@@ -1,13 +1,20 @@
 
+import struct
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from deadlock_detector import Process, Resource, AllocationMatrix, detect_deadlock
+from deadlock_detector import (Process, Resource, AllocationMatrix, DetectionStep, DetectionResult,
+                               detect_deadlock, calculate_available_resources, build_demand_arrays)
 
 class ResourceManager:
+    RESULT_CACHE_SIZE = 8  # Number of detection results kept per manager
+    
     def __init__(self):
         self.matrix = AllocationMatrix()
         self._allocation_df = None  # DataFrame for allocations
         self._request_df = None     # DataFrame for requests
+        self._result_cache = OrderedDict()  # Encoded state -> DetectionResult, LRU order
+        self._frames_key = None             # Encoded state the DataFrames were built from
         self._update_dataframes()
     
     def add_process(self, process_id):
@@ -81,11 +88,13 @@ class ResourceManager:
         if value > max_allowable:
             value = max_allowable
             
-        # Update allocation
+        # Nothing to do if the clamped allocation is already stored as-is
+        current = process.allocation.get(resource_id)
+        if type(current) is type(value) and current == value:
+            return value
+            
+        # Update allocation; the DataFrames are rebuilt when next read
         process.allocation[resource_id] = value
-        
-        # Update DataFrames
-        self._update_dataframes()
         return value  # Return the actual value set (might be limited)
     
     def update_request(self, process_id, resource_id, value):
@@ -100,11 +109,13 @@ class ResourceManager:
         if not process or not resource:
             raise ValueError(f"Process {process_id} or Resource {resource_id} not found")
             
-        # Update request
+        # Nothing to do if the request is already stored as-is
+        current = process.request.get(resource_id)
+        if type(current) is type(value) and current == value:
+            return True
+            
+        # Update request; the DataFrames are rebuilt when next read
         process.request[resource_id] = value
-        
-        # Update DataFrames
-        self._update_dataframes()
         return True
     
     def remove_process(self, process_id):
@@ -135,24 +146,99 @@ class ResourceManager:
     
     def detect_deadlock(self):
         """Run deadlock detection algorithm using current state"""
-        return detect_deadlock(self.matrix)
+        key = self._fingerprint()
+        if key is None:
+            return detect_deadlock(self.matrix)
+            
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+            return self._copy_result(result)
+            
+        result = detect_deadlock(self.matrix)
+        self._result_cache[key] = result
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return self._copy_result(result)
+    
+    @staticmethod
+    def _copy_result(result):
+        """Copy a cached result so callers can't modify the cache entry"""
+        copy = DetectionResult()
+        copy.deadlocked = list(result.deadlocked)
+        copy.safe_sequence = list(result.safe_sequence) if result.safe_sequence is not None else None
+        copy.steps = [
+            DetectionStep(
+                step.description,
+                list(step.remaining_processes),
+                dict(step.available_resources),
+                list(step.processed_this_round)
+            )
+            for step in result.steps
+        ]
+        return copy
+    
+    def _fingerprint(self):
+        """Encode the current state as an exact cache key (None if not encodable)"""
+        # Every request/allocation entry is encoded in dict order, including
+        # resources outside matrix.resources, since detect_deadlock reads them too
+        processes = self.matrix.processes
+        buf = bytearray(struct.pack('<II', len(self.matrix.resources), len(processes)))
+        try:
+            for resource in self.matrix.resources:
+                encoded = resource.id.encode()
+                buf += struct.pack('<I', len(encoded)) + encoded
+                buf += struct.pack('<q?', resource.total, resource.is_multi_instance)
+            for process in processes:
+                encoded = process.id.encode()
+                buf += struct.pack('<I', len(encoded)) + encoded
+                for counts in (process.allocation, process.request):
+                    keys = [resource_id.encode() for resource_id in counts]
+                    buf += struct.pack(f'<I{len(keys)}I', len(keys), *map(len, keys))
+                    buf += b''.join(keys)
+                    buf += struct.pack(f'<{len(keys)}q', *counts.values())
+        except (struct.error, AttributeError):
+            return None  # Non-integer values or non-string IDs, not cacheable
+        # The encoded state itself is the key: exact, no hash collisions
+        return bytes(buf)
+    
+    def _refresh_dataframes(self):
+        """Rebuild the DataFrames if the matrix changed since they were built"""
+        # Also catches direct edits of manager.matrix; unencodable state always rebuilds
+        if self._frames_key is None or self._fingerprint() != self._frames_key:
+            self._update_dataframes()
     
     def _update_dataframes(self):
         """Update pandas DataFrames for allocation and request"""
+        self._frames_key = self._fingerprint()
+        
         # If no processes or resources, create empty DataFrames
         if not self.matrix.processes or not self.matrix.resources:
             self._allocation_df = pd.DataFrame()
             self._request_df = pd.DataFrame()
             return
             
-        # Create allocation DataFrame
+        process_ids = [p.id for p in self.matrix.processes]
+        resource_ids = [r.id for r in self.matrix.resources]
+        
+        # Fill preallocated int64 arrays straight from the per-process dicts;
+        # the resource columns come first in build_demand_arrays' index
+        alloc_data, req_data, _ = build_demand_arrays(self.matrix)
+        if (alloc_data.dtype == np.int64 and len(set(process_ids)) == len(process_ids)
+                and len(set(resource_ids)) == len(resource_ids)):
+            n = len(resource_ids)
+            self._allocation_df = pd.DataFrame(alloc_data[:, :n], index=process_ids, columns=resource_ids)
+            self._request_df = pd.DataFrame(req_data[:, :n], index=process_ids, columns=resource_ids)
+            return
+            
+        # Non-integer counts or repeated IDs: let pandas infer the dtypes and
+        # keep one row/column per ID, as the dict-of-dicts construction does
         alloc_data = {}
         for process in self.matrix.processes:
             alloc_data[process.id] = {r.id: process.allocation.get(r.id, 0) for r in self.matrix.resources}
             
         self._allocation_df = pd.DataFrame(alloc_data).T
         
-        # Create request DataFrame
         req_data = {}
         for process in self.matrix.processes:
             req_data[process.id] = {r.id: process.request.get(r.id, 0) for r in self.matrix.resources}
@@ -191,21 +277,25 @@ class ResourceManager:
     @property
     def allocation_matrix(self):
         """Get allocation matrix as numpy array"""
+        self._refresh_dataframes()
         return self._allocation_df.to_numpy() if not self._allocation_df.empty else np.array([])
     
     @property
     def request_matrix(self):
         """Get request matrix as numpy array"""
+        self._refresh_dataframes()
         return self._request_df.to_numpy() if not self._request_df.empty else np.array([])
     
     @property
     def allocation_dataframe(self):
         """Get allocation DataFrame"""
+        self._refresh_dataframes()
         return self._allocation_df
     
     @property
     def request_dataframe(self):
         """Get request DataFrame"""
+        self._refresh_dataframes()
         return self._request_df
     
     def get_available_resources(self):
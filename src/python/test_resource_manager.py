@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+import resource_manager
+from resource_manager import ResourceManager
+
+
+class DetectionCacheTest(unittest.TestCase):
+    """Result cache behind ResourceManager.detect_deadlock"""
+
+    def setUp(self):
+        self.manager = ResourceManager()
+        self.manager.load_example()
+        patcher = mock.patch.object(resource_manager, "detect_deadlock", wraps=resource_manager.detect_deadlock)
+        self.detect = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_state_hits_cache(self):
+        first = self.manager.detect_deadlock()
+        second = self.manager.detect_deadlock()
+        self.assertEqual(self.detect.call_count, 1)
+        self.assertEqual(first.safe_sequence, second.safe_sequence)
+
+    def test_manager_edit_misses_cache(self):
+        self.assertEqual(self.manager.detect_deadlock().deadlocked, [])
+        self.manager.update_request("P3", "R1", 1)
+        self.assertEqual(self.manager.detect_deadlock().deadlocked, ["P1", "P2", "P3"])
+        self.assertEqual(self.detect.call_count, 2)
+
+    def test_direct_matrix_edits_miss_cache(self):
+        self.manager.detect_deadlock()
+        self.manager.matrix.resources[0].total = 0
+        self.assertEqual(self.manager.detect_deadlock().deadlocked, ["P2"])
+        self.manager.matrix.resources[0].total = 1
+        self.manager.matrix.processes[2].request["R1"] = 1
+        self.manager.matrix.processes[1].request["R2"] = 1
+        self.assertEqual(self.manager.detect_deadlock().deadlocked, ["P1", "P2", "P3"])
+        self.assertEqual(self.detect.call_count, 3)
+
+    def test_resources_outside_matrix_are_part_of_the_key(self):
+        process = self.manager.matrix.processes[0]
+        process.request["X"] = 1
+        self.assertIn("P1", self.manager.detect_deadlock().deadlocked)
+        process.request["X"] = 0
+        self.assertEqual(self.manager.detect_deadlock().deadlocked, [])
+        self.assertEqual(self.detect.call_count, 2)
+
+    def test_results_are_copies(self):
+        first = self.manager.detect_deadlock()
+        step_count = len(first.steps)
+        first.steps.clear()
+        first.safe_sequence.clear()
+        second = self.manager.detect_deadlock()
+        self.assertEqual(len(second.steps), step_count)
+        self.assertEqual(second.safe_sequence, ["P3", "P1", "P2"])
+        second.steps[0].available_resources.clear()
+        self.assertEqual(self.manager.detect_deadlock().steps[0].available_resources, {"R1": 0, "R2": 0})
+        self.assertEqual(self.detect.call_count, 1)
+
+    def test_oldest_result_is_evicted(self):
+        self.manager.detect_deadlock()
+        for value in range(1, ResourceManager.RESULT_CACHE_SIZE + 1):
+            self.manager.update_request("P3", "R2", value)
+            self.manager.detect_deadlock()
+        self.assertEqual(len(self.manager._result_cache), ResourceManager.RESULT_CACHE_SIZE)
+
+        # The first state was pushed out, the most recent one is still cached
+        calls = self.detect.call_count
+        self.manager.update_request("P3", "R2", ResourceManager.RESULT_CACHE_SIZE)
+        self.manager.detect_deadlock()
+        self.assertEqual(self.detect.call_count, calls)
+        self.manager.update_request("P3", "R2", 0)
+        self.manager.detect_deadlock()
+        self.assertEqual(self.detect.call_count, calls + 1)
+
+    def test_unencodable_state_is_not_cached(self):
+        self.manager.matrix.processes[0].request["R2"] = 0.5
+        self.manager.detect_deadlock()
+        self.manager.detect_deadlock()
+        self.assertEqual(self.detect.call_count, 2)
+        self.assertEqual(len(self.manager._result_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()